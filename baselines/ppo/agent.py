@@ -85,14 +85,20 @@ class Agent(BaseAgent):
         self.total_timestep = 0
         self.policy_optimizer = optim.Adam(self.policy.parameters(), lr=config['agent.policy_lr'])
         self.value_optimizer = optim.Adam(self.value.parameters(), lr=config['agent.value_lr'])
+        # decide once here, so learn_one_update() checks the attribute instead of a config dict lookup
         if config['agent.use_lr_scheduler']:
             self.policy_lr_scheduler = linear_lr_scheduler(self.policy_optimizer, config['train.timestep'], min_lr=1e-8)
+        else:
+            self.policy_lr_scheduler = None
         
     def choose_action(self, x, **kwargs):
         obs = tensorify(x.observation, self.device).unsqueeze(0)
         action_dist = self.policy(obs)
         V = self.value(obs)
         action = action_dist.sample()
+        # torch.any forces a device sync, so the check only runs in debug mode (stripped by -O)
+        if __debug__ and torch.any(torch.isnan(action)):
+            raise ValueError('NaN detected in sampled action')
         out = {}
         out['action_dist'] = action_dist
         out['V'] = V
@@ -110,7 +116,7 @@ class Agent(BaseAgent):
         logprobs = action_dist.log_prob(old_actions).squeeze()
         entropies = action_dist.entropy().squeeze()
         Vs = self.value(observations).squeeze()
-        assert all([x.ndim == 1 for x in [logprobs, entropies, Vs]])
+        assert all(x.ndim == 1 for x in [logprobs, entropies, Vs])
         
         ratio = torch.exp(logprobs - old_logprobs)
         eps = self.config['agent.clip_range']
@@ -122,7 +128,7 @@ class Agent(BaseAgent):
         policy_loss.backward()
         policy_grad_norm = nn.utils.clip_grad_norm_(self.policy.parameters(), self.config['agent.max_grad_norm'])
         self.policy_optimizer.step()
-        if self.config['agent.use_lr_scheduler']:
+        if self.policy_lr_scheduler is not None:
             self.policy_lr_scheduler.step(self.total_timestep)
         
         clipped_Vs = old_Vs + torch.clamp(Vs - old_Vs, -eps, eps)
@@ -147,32 +153,36 @@ class Agent(BaseAgent):
         return out
         
     def learn(self, D, **kwargs):
-        logprobs = [torch.cat(traj.get_infos('action_logprob')) for traj in D]
-        entropies = [torch.cat(traj.get_infos('entropy')) for traj in D]
+        logprobs = torch.cat([logprob for traj in D for logprob in traj.get_infos('action_logprob')]).squeeze()
+        entropies = torch.cat([entropy for traj in D for entropy in traj.get_infos('entropy')]).squeeze()
         Vs = [torch.cat(traj.get_infos('V')) for traj in D]
         with torch.no_grad():
             last_observations = tensorify([traj[-1].observation for traj in D], self.device)
             last_Vs = self.value(last_observations).squeeze(-1)
+        # one device-to-host transfer for all trajectories, instead of one per numpify call below
+        last_Vs = numpify(last_Vs, np.float32)
+        num_steps = [traj.T for traj in D]
+        Vs = torch.cat(Vs).squeeze()
+        numpy_Vs = np.split(numpify(Vs, np.float32), np.cumsum(num_steps)[:-1])
         Qs = [bootstrapped_returns(self.config['agent.gamma'], traj.rewards, last_V, traj.reach_terminal)
               for traj, last_V in zip(D, last_Vs)]
         As = [gae(self.config['agent.gamma'], self.config['agent.gae_lambda'], traj.rewards, V, last_V, traj.reach_terminal)
-              for traj, V, last_V in zip(D, Vs, last_Vs)]
-        
+              for traj, V, last_V in zip(D, numpy_Vs, last_Vs)]
+
         # Metrics -> Tensor, device
-        logprobs, entropies, Vs = map(lambda x: torch.cat(x).squeeze(), [logprobs, entropies, Vs])
-        Qs, As = map(lambda x: tensorify(np.concatenate(x).copy(), self.device), [Qs, As])
+        Qs, As = map(lambda x: tensorify(np.concatenate(x), self.device), [Qs, As])
         if self.config['agent.standardize_adv']:
             As = (As - As.mean())/(As.std() + 1e-4)
-        assert all([x.ndim == 1 for x in [logprobs, entropies, Vs, Qs, As]])
+        assert all(x.ndim == 1 for x in [logprobs, entropies, Vs, Qs, As])
         
         dataset = Dataset(D, logprobs, entropies, Vs, Qs, As)
         dataloader = DataLoader(dataset, self.config['train.batch_size'], shuffle=True)
         for epoch in range(self.config['train.num_epochs']):
             logs = [self.learn_one_update(data) for data in dataloader]
 
-        self.total_timestep += sum([traj.T for traj in D])
+        self.total_timestep += sum(traj.T for traj in D)
         out = {}
-        if self.config['agent.use_lr_scheduler']:
+        if self.policy_lr_scheduler is not None:
             out['current_lr'] = self.policy_lr_scheduler.get_lr()
         out['policy_grad_norm'] = np.mean([item['policy_grad_norm'] for item in logs])
         out['value_grad_norm'] = np.mean([item['value_grad_norm'] for item in logs])
@@ -14,10 +14,10 @@ class Dataset(data.Dataset):
         self.Qs = Qs
         self.As = As
         assert self.observations.shape[0] == len(self) and self.actions.shape[0] == len(self)
-        assert all([i.shape == (len(self),) for i in [self.logprobs, self.entropies, self.Vs, self.Qs, self.As]])
+        assert all(i.shape == (len(self),) for i in [self.logprobs, self.entropies, self.Vs, self.Qs, self.As])
 
     def __len__(self):
-        return sum([traj.T for traj in self.D])
+        return sum(traj.T for traj in self.D)
 
     def __getitem__(self, i):
         D = (self.observations[i], self.actions[i], self.logprobs[i], 
@@ -18,7 +18,7 @@ class Engine(BaseEngine):
         logger('num_seconds', round(time.perf_counter() - t0, 1))
         [logger(key, value) for key, value in out_agent.items()]
         logger('num_trajectories', len(D))
-        logger('num_timesteps', sum([traj.T for traj in D]))
+        logger('num_timesteps', sum(traj.T for traj in D))
         logger('accumulated_trained_timesteps', self.agent.total_timestep)
         logger('return', describe([sum(traj.rewards) for traj in D], axis=-1, repr_indent=1, repr_prefix='\n'))
         
@@ -47,6 +47,10 @@ class Agent(BaseAgent):
         
         feature_dim = config['nn.sizes'][-1]
         self.feature_network = MLP(config, env, device, **kwargs)
+        if config.get('nn.compile', False) and hasattr(self.feature_network, 'compile'):
+            # fuses the linear/relu/layernorm chain into a few kernels; in-place compile
+            # keeps state_dict keys unchanged so checkpoints stay loadable
+            self.feature_network.compile()
         if isinstance(env.action_space, spaces.Discrete):
             self.action_head = CategoricalHead(feature_dim, env.action_space.n, device, **kwargs)
         elif isinstance(env.action_space, spaces.Box):
@@ -57,42 +61,61 @@ class Agent(BaseAgent):
         
         self.total_timestep = 0
         self.optimizer = optim.Adam(self.parameters(), lr=config['agent.lr'])
+        # decide once here, so learn() checks the attribute instead of a config dict lookup per update
         if config['agent.use_lr_scheduler']:
             self.lr_scheduler = linear_lr_scheduler(self.optimizer, config['train.timestep'], min_lr=1e-8)
+        else:
+            self.lr_scheduler = None
         
     def choose_action(self, x, **kwargs):
         obs = tensorify(x.observation, self.device).unsqueeze(0)
-        features = self.feature_network(obs)
-        action_dist = self.action_head(features)
-        V = self.V_head(features)
-        action = action_dist.sample()
-        out = {}
-        out['action_dist'] = action_dist
-        out['V'] = V
-        out['entropy'] = action_dist.entropy()
-        out['action'] = action
-        out['raw_action'] = numpify(action, self.env.action_space.dtype).squeeze(0)
-        out['action_logprob'] = action_dist.log_prob(action.detach())
+        with torch.no_grad():  # graph is rebuilt in one batched forward in learn()
+            features = self.feature_network(obs)
+            action_dist = self.action_head(features)
+            V = self.V_head(features)
+            action = action_dist.sample()
+            # torch.any forces a device sync, so the check only runs in debug mode (stripped by -O)
+            if __debug__ and torch.any(torch.isnan(action)):
+                raise ValueError('NaN detected in sampled action')
+            out = {}
+            out['action_dist'] = action_dist
+            out['V'] = V
+            out['entropy'] = action_dist.entropy()
+            out['action'] = action
+            out['raw_action'] = numpify(action, self.env.action_space.dtype).squeeze(0)
+            out['action_logprob'] = action_dist.log_prob(action)
         return out
-    
+
     def learn(self, D, **kwargs):
-        logprobs = [torch.cat(traj.get_infos('action_logprob')) for traj in D]
-        entropies = [torch.cat(traj.get_infos('entropy')) for traj in D]
-        Vs = [torch.cat(traj.get_infos('V')) for traj in D]
-        with torch.no_grad():
-            last_observations = tensorify([traj[-1].observation for traj in D], self.device)
-            last_Vs = self.V_head(self.feature_network(last_observations)).squeeze(-1)
+        # Re-forward all trajectory states in a single batch: one GEMM per head instead of
+        # T tiny per-step forwards, and the rollout itself runs without autograd.
+        num_steps = [traj.T for traj in D]
+        observations = tensorify(np.concatenate([np.stack(traj.observations, 0) for traj in D], 0), self.device)
+        actions = tensorify(np.concatenate([np.stack(traj.actions, 0) for traj in D], 0), self.device)
+        # each trajectory contributes T state rows followed by its last observation
+        starts = np.cumsum([0] + [traj.T + 1 for traj in D[:-1]])
+        state_idx = np.concatenate([np.arange(start, start + T) for start, T in zip(starts, num_steps)])
+        last_idx = starts + np.asarray(num_steps)
+
+        features = self.feature_network(observations)
+        all_Vs = self.V_head(features).squeeze(-1)
+        action_dist = self.action_head(features[state_idx])
+        logprobs = action_dist.log_prob(actions).squeeze()
+        entropies = action_dist.entropy().squeeze()
+        Vs = all_Vs[state_idx]
+        # one device-to-host transfer for all trajectories, instead of one per numpify call below
+        last_Vs = numpify(all_Vs[last_idx], np.float32)
+        numpy_Vs = np.split(numpify(Vs, np.float32), np.cumsum(num_steps)[:-1])
         Qs = [bootstrapped_returns(self.config['agent.gamma'], traj.rewards, last_V, traj.reach_terminal)
               for traj, last_V in zip(D, last_Vs)]
         As = [gae(self.config['agent.gamma'], self.config['agent.gae_lambda'], traj.rewards, V, last_V, traj.reach_terminal)
-              for traj, V, last_V in zip(D, Vs, last_Vs)]
-        
+              for traj, V, last_V in zip(D, numpy_Vs, last_Vs)]
+
         # Metrics -> Tensor, device
-        logprobs, entropies, Vs = map(lambda x: torch.cat(x).squeeze(), [logprobs, entropies, Vs])
-        Qs, As = map(lambda x: tensorify(np.concatenate(x).copy(), self.device), [Qs, As])
+        Qs, As = map(lambda x: tensorify(np.concatenate(x), self.device), [Qs, As])
         if self.config['agent.standardize_adv']:
             As = (As - As.mean())/(As.std() + 1e-4)
-        assert all([x.ndim == 1 for x in [logprobs, entropies, Vs, Qs, As]])
+        assert all(x.ndim == 1 for x in [logprobs, entropies, Vs, Qs, As])
         
         # Loss
         policy_loss = -logprobs*As.detach()
@@ -105,12 +128,12 @@ class Agent(BaseAgent):
         loss.backward()
         grad_norm = nn.utils.clip_grad_norm_(self.parameters(), self.config['agent.max_grad_norm'])
         self.optimizer.step()
-        if self.config['agent.use_lr_scheduler']:
+        if self.lr_scheduler is not None:
             self.lr_scheduler.step(self.total_timestep)
-        self.total_timestep += sum([traj.T for traj in D])
+        self.total_timestep += sum(traj.T for traj in D)
         
         out = {}
-        if self.config['agent.use_lr_scheduler']:
+        if self.lr_scheduler is not None:
             out['current_lr'] = self.lr_scheduler.get_lr()
         out['loss'] = loss.item()
         out['grad_norm'] = grad_norm
@@ -26,6 +26,8 @@ config = Config(
      'env.normalize_reward': True,
      
      'nn.sizes': [64, 64],
+     'nn.compile': False,  # torch.compile the feature network, pays off for long runs
+
      
      'agent.lr': 1e-3,
      'agent.use_lr_scheduler': False,
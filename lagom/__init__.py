@@ -18,3 +18,4 @@ from .logger import Logger
 from .runner import BaseRunner
 from .runner import EpisodeRunner
 from .runner import StepRunner
+from .runner import VecStepRunner
@@ -22,7 +22,7 @@ class TimeStep:
     
     def first(self):
         if self.step_type == StepType.FIRST:
-            assert all([x is None for x in [self.reward, self.done, self.info]])
+            assert all(x is None for x in [self.reward, self.done, self.info])
         return self.step_type == StepType.FIRST
     
     def mid(self):
@@ -158,13 +158,18 @@ class VecEnv(object):
     
     @property
     def unwrapped(self):
-        r"""Unwrap this vectorized environment. 
-        
-        Useful for sequential wrappers applied, it can access information from the original 
-        vectorized environment. 
+        r"""Unwrap this vectorized environment.
+
+        Useful for sequential wrappers applied, it can access information from the original
+        vectorized environment.
         """
         return self
-    
+
+    @property
+    def num_envs(self):
+        r"""Returns the number of sub-environments. """
+        return len(self.list_make_env)
+
     def __len__(self):
         return len(self.list_make_env)
     
@@ -1,10 +1,11 @@
 import os
+import tarfile
 from shutil import rmtree
-from shutil import copyfile
 from pathlib import Path
 import inspect
 from itertools import product
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 import torch
 from lagom.utils import pickle_dump
@@ -15,8 +16,14 @@ from lagom.utils import color_str
 from lagom.utils import CloudpickleWrapper
 
 
+def _init_worker():
+    r"""Pays the heavy torch import and thread setup once per worker instead of once per job. """
+    import torch
+    torch.set_num_threads(1)
+
+
 @timeit(color='green', attribute='bold')
-def run_experiment(run, config, seeds, log_dir, max_workers, chunksize=1, use_gpu=False, gpu_ids=None):
+def run_experiment(run, config, seeds, log_dir, max_workers, chunksize=1, use_gpu=False, gpu_ids=None, backend='process'):
     r"""A convenient function to parallelize the experiment (master-worker pipeline). 
     
     It is implemented by using `concurrent.futures.ProcessPoolExecutor`
@@ -60,9 +67,15 @@ def run_experiment(run, config, seeds, log_dir, max_workers, chunksize=1, use_gp
         chunksize (int): argument for Executor.map()
         use_gpu (bool): if `True`, then use CUDA. Otherwise, use CPU.
         gpu_ids (list): if `None`, then use all available GPUs. Otherwise, only use the
-            GPU device defined in the list. 
-    
+            GPU device defined in the list. Only supported by the `'process'` backend,
+            the `'ray'` backend delegates GPU placement to Ray's scheduler.
+        backend (str): either `'process'` (default) to parallelize with `ProcessPoolExecutor`
+            or `'ray'` to submit the jobs as Ray tasks. Ray stores large read-only objects
+            (e.g. configurations) in its shared object store once instead of re-pickling them
+            for each dispatch. Requires `ray` to be installed.
+
     """
+    assert backend in ['process', 'ray'], f'expected process or ray, got {backend}'
     configs = config.make_configs()
     
     # create logging dir
@@ -82,18 +95,21 @@ def run_experiment(run, config, seeds, log_dir, max_workers, chunksize=1, use_gp
             print(f"The old logging directory is renamed to '{old_log_path.absolute()}'. ")
             input('Please, press Enter to continue\n>>> ')
 
-    # save source files
+    # save source files: one sequential archive write instead of one copy (and syscalls) per file
     source_path = Path(log_path / 'source_files/')
     source_path.mkdir(parents=True)
-    [copyfile(s, source_path / s.name) for s in Path(inspect.getsourcefile(run)).parent.glob('*.py')]
+    with tarfile.open(source_path / 'source_files.tar', 'w') as tf:
+        [tf.add(s, arcname=s.name) for s in Path(inspect.getsourcefile(run)).parent.glob('*.py')]
     
     # Create subfolders for each ID and subsubfolders for each random seed
+    # mkdir is IO-bound (GIL released in the syscall), so issue the whole sweep through a
+    # thread pool: on networked filesystems this amortizes the per-directory latency
+    subfolders = [log_path / f'{config["ID"]}' / f'{seed}' for config in configs for seed in seeds]
+    if subfolders:  # empty seeds: keep the previous no-op instead of a zero-worker pool
+        with ThreadPoolExecutor(max_workers=min(32, len(subfolders))) as executor:
+            list(executor.map(lambda p: p.mkdir(parents=True, exist_ok=True), subfolders))
     for config in configs:
-        ID = config['ID']
-        for seed in seeds:
-            p = log_path / f'{ID}' / f'{seed}'
-            p.mkdir(parents=True)
-        yaml_dump(obj=config, f=log_path / f'{ID}' / 'config', ext='.yml')
+        yaml_dump(obj=config, f=log_path / f'{config["ID"]}' / 'config', ext='.yml')
         
     pickle_dump(configs, log_path / 'configs', ext='.pkl')
     
@@ -112,7 +128,7 @@ def run_experiment(run, config, seeds, log_dir, max_workers, chunksize=1, use_gp
             if gpu_ids is None:  # use all GPUs
                 device_id = job_id % num_gpu
             else:
-                assert all([i >= 0 and i < num_gpu for i in gpu_ids])
+                assert all(i >= 0 and i < num_gpu for i in gpu_ids)
                 device_id = gpu_ids[job_id % len(gpu_ids)]
             torch.cuda.set_device(device_id)
             device = torch.device(f'cuda:{device_id}')
@@ -133,8 +149,22 @@ def run_experiment(run, config, seeds, log_dir, max_workers, chunksize=1, use_gp
     
     if max_workers is None:
         results = [_run(job) for job in jobs]
+    elif backend == 'ray':
+        import ray
+        ray.init(num_cpus=min(max_workers, len(jobs)),
+                 num_gpus=torch.cuda.device_count() if use_gpu else 0,
+                 ignore_reinit_error=True)
+        assert gpu_ids is None, 'gpu_ids is only supported by the process backend'
+        # Ray serializes with cloudpickle internally, no CloudpickleWrapper needed.
+        # Request GPU resources per task, otherwise Ray masks CUDA_VISIBLE_DEVICES to the
+        # empty set and every job silently falls back to CPU. With a fractional request
+        # each task sees exactly its assigned GPU, so the job_id-based device selection
+        # in _run reduces to cuda:0 of the masked view.
+        remote_run = ray.remote(num_gpus=0.5 if use_gpu else 0)(_run)
+        results = ray.get([remote_run.remote(job) for job in jobs])
     else:
-        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs)),
+                                 initializer=_init_worker) as executor:
             results = list(executor.map(CloudpickleWrapper(_run), jobs, chunksize=chunksize))
     print(color_str(f'\nExperiment finished. Loggings are stored in {log_path.absolute()}. ', 'cyan', 'bold'))
     return results
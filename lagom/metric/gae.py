@@ -16,4 +16,4 @@ def gae(gamma, lam, rewards, Vs, last_V, reach_terminal):
     
     """
     delta = td0_error(gamma, rewards, Vs, last_V, reach_terminal)
-    return geometric_cumsum(gamma*lam, delta)[0].astype(np.float32)
+    return geometric_cumsum(gamma*lam, delta)[0].astype(np.float32, copy=False)
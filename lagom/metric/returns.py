@@ -5,7 +5,7 @@ from lagom.utils import numpify
 
 
 def returns(gamma, rewards):
-    return geometric_cumsum(gamma, rewards)[0, :].astype(np.float32)
+    return geometric_cumsum(gamma, rewards)[0, :].astype(np.float32, copy=False)
 
 
 def bootstrapped_returns(gamma, rewards, last_V, reach_terminal):
@@ -28,4 +28,4 @@ def bootstrapped_returns(gamma, rewards, last_V, reach_terminal):
         out = geometric_cumsum(gamma, np.append(rewards, 0.0))
     else:
         out = geometric_cumsum(gamma, np.append(rewards, last_V))
-    return out[0, :-1].astype(np.float32)
+    return out[0, :-1].astype(np.float32, copy=False)
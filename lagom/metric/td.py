@@ -27,7 +27,7 @@ def td0_target(gamma, rewards, Vs, last_V, reach_terminal):
     else:
         Vs = np.append(Vs, last_V)
     out = rewards + gamma*Vs[1:]
-    return out.astype(np.float32)
+    return out.astype(np.float32, copy=False)
 
 
 def td0_error(gamma, rewards, Vs, last_V, reach_terminal):
@@ -54,4 +54,4 @@ def td0_error(gamma, rewards, Vs, last_V, reach_terminal):
     else:
         Vs = np.append(Vs, last_V)
     out = rewards + gamma*Vs[1:] - Vs[:-1]
-    return out.astype(np.float32)
+    return out.astype(np.float32, copy=False)
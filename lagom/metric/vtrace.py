@@ -11,7 +11,7 @@ def vtrace(behavior_logprobs, target_logprobs, gamma, Rs, Vs, last_V, reach_term
     Rs = numpify(Rs, np.float32)
     Vs = numpify(Vs, np.float32)
     last_V = numpify(last_V, np.float32)
-    assert all([item.ndim == 1 for item in [behavior_logprobs, target_logprobs, Rs, Vs]])
+    assert all(item.ndim == 1 for item in [behavior_logprobs, target_logprobs, Rs, Vs])
     assert np.isscalar(gamma)
 
     rhos = np.exp(target_logprobs - behavior_logprobs)
@@ -5,6 +5,7 @@ from lagom.data import StepType
 from lagom.data import TimeStep
 from lagom.data import Trajectory
 from lagom.envs.timestep_env import TimeStepEnv
+from lagom.envs.wrappers.vec_step_info import VecStepInfo
 
 
 class BaseRunner(ABC):
@@ -74,3 +75,57 @@ class StepRunner(BaseRunner):
         if not self.reset_on_call:
             self.observation = timestep.observation
         return D
+
+
+class VecStepRunner(BaseRunner):
+    r"""Collects trajectories from a vectorized environment.
+
+    The agent receives the batched observations from all sub-environments at once, so the policy
+    runs a single forward pass of batch size `N` per environment step, instead of `N` sequential
+    calls with batch size one. One trajectory grows per sub-environment and is split out whenever
+    that sub-environment terminates (the vectorized environment resets it automatically).
+
+    .. note::
+
+        `T` counts time steps per sub-environment, so one call collects `N*T` transitions in total.
+
+    .. note::
+
+        The agent's ``choose_action`` must accept the batched observation array and return
+        batched outputs. The agents under ``baselines`` forward a single :class:`TimeStep`
+        per call, so they cannot drive this runner yet; :class:`RandomAgent` can. Per-step
+        agent outputs are fanned out by indexing along the batch dimension, outputs that do
+        not support indexing (e.g. a batched ``action_dist``) are dropped from the step infos.
+
+    """
+    def __call__(self, agent, env, T, **kwargs):
+        assert isinstance(env, VecStepInfo)
+        D = []
+        observations, _ = env.reset()
+        trajs = []
+        for observation in observations:
+            traj = Trajectory()
+            traj.add(TimeStep(StepType.FIRST, observation=observation, reward=None, done=None, info=None), None)
+            trajs.append(traj)
+        for t in range(T):
+            out_agent = agent.choose_action(observations, **kwargs)
+            actions = out_agent.pop('raw_action')
+            next_observations, rewards, step_infos = env.step(actions)
+            for i, (action, reward, step_info) in enumerate(zip(actions, rewards, step_infos)):
+                agent_info = {key: value[i] for key, value in out_agent.items() if hasattr(value, '__getitem__')}
+                info = {**step_info.info, **agent_info}
+                if step_info.last:
+                    observation = info.pop('last_observation')
+                    step_type = StepType.LAST
+                else:
+                    observation = next_observations[i]
+                    step_type = StepType.MID
+                trajs[i].add(TimeStep(step_type, observation=observation, reward=reward, done=step_info.done, info=info), action)
+                if step_info.last:
+                    D.append(trajs[i])
+                    traj = Trajectory()
+                    traj.add(TimeStep(StepType.FIRST, observation=next_observations[i], reward=None, done=None, info=None), None)
+                    trajs[i] = traj
+            observations = next_observations
+        D.extend([traj for traj in trajs if traj.T > 0])
+        return D
@@ -1,33 +1,80 @@
 import numpy as np
 from scipy.signal import lfilter
 
+try:  # optional speedup, the pure numpy fallback is used when numba is unavailable
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def geometric_cumsum(alpha, x, mask=None):
+    r"""Calculate future accumulated sums for each element in a list with an exponential factor.
 
-def geometric_cumsum(alpha, x):
-    r"""Calculate future accumulated sums for each element in a list with an exponential factor. 
-    
     Given input data :math:`x_1, \dots, x_n` and exponential factor :math:`\alpha\in [0, 1]`, it returns
     an array :math:`y` with the same length and each element is calculated as following
-    
+
     .. math::
         y_i = x_i + \alpha x_{i+1} + \alpha^2 x_{i+2} + \dots + \alpha^{n-i-1}x_{n-1} + \alpha^{n-i}x_{n}
-            
+
     .. note::
         To gain the optimal runtime speed, we use ``scipy.signal.lfilter``
-    
+
     Example:
-    
+
         >>> geometric_cumsum(0.1, [1, 2, 3, 4])
         array([[1.234, 2.34 , 3.4  , 4.   ]])
-    
+
     Args:
-        alpha (float): exponential factor between zero and one. 
+        alpha (float): exponential factor between zero and one.
         x (list): input data
-            
+        mask (list, optional): binary mask with the same shape as ``x``, zero at the positions
+            where the accumulation should be reset (e.g. terminal states in a batch of
+            concatenated episodes). If ``None``, the sum is accumulated over the entire axis.
+
     Returns:
         ndarray: calculated data
     """
-    x = np.asarray(x)
+    # float32 throughout: matches the dtype of the downstream policy/value tensors
+    # and halves the memory traffic compared to numpy's default float64
+    x = np.asarray(x, dtype=np.float32)
     if x.ndim == 1:
         x = np.expand_dims(x, 0)
-    assert x.ndim == 2 
-    return lfilter([1], [1, -alpha], x[:, ::-1], axis=1)[:, ::-1]
+    assert x.ndim >= 2
+    if mask is None:
+        # coefficient arrays must share x's dtype, otherwise lfilter upcasts to float64
+        b = np.asarray([1.0], dtype=x.dtype)
+        a = np.asarray([1.0, -alpha], dtype=x.dtype)
+        return lfilter(b, a, x[..., ::-1], axis=-1)[..., ::-1]
+    mask = np.asarray(mask, dtype=np.float32)
+    if mask.ndim == 1:
+        mask = np.expand_dims(mask, 0)
+    assert mask.shape == x.shape
+    return _masked_geometric_cumsum(alpha, x, mask)
+
+
+def _masked_geometric_cumsum(alpha, x, mask):
+    x = np.ascontiguousarray(x)
+    mask = np.ascontiguousarray(mask)
+    out = np.zeros(x.shape, dtype=x.dtype)
+    T = x.shape[-1]
+    if njit is not None:
+        _masked_scan(alpha, x.reshape(-1, T), mask.reshape(-1, T), out.reshape(-1, T))
+        return out
+    # reverse scan over the time axis, vectorized over the leading (batch) axes
+    acc = np.zeros(x.shape[:-1], dtype=x.dtype)
+    for t in range(T - 1, -1, -1):
+        acc = x[..., t] + alpha*mask[..., t]*acc
+        out[..., t] = acc
+    return out
+
+
+if njit is not None:
+    # serial on purpose: parallel=True spins up numba's threading layer, which is not
+    # fork-safe and deadlocks the fork-based multiprocessing used elsewhere in lagom
+    @njit(cache=True, fastmath=True)
+    def _masked_scan(alpha, x, mask, out):
+        for i in range(x.shape[0]):
+            acc = 0.0
+            for t in range(x.shape[1] - 1, -1, -1):
+                acc = x[i, t] + alpha*mask[i, t]*acc
+                out[i, t] = acc
@@ -32,7 +32,7 @@ def rank_transform(x, centered=True):
     assert x.ndim == 1, 'must be one dimensional, i.e. a vector of scalar values'
     
     ranks = np.empty(len(x), dtype=int)
-    ranks[x.argsort()] = np.arange(len(x))
+    ranks[x.argsort(kind='stable')] = np.arange(len(x))
     if centered:
         ranks = ranks/(ranks.size - 1) - 0.5
     return ranks
@@ -1,5 +1,10 @@
 import numpy as np
 
+try:  # optional speedup, the pure numpy fallback is used when numba is unavailable
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 class RunningMeanVar(object):
     r"""Estimates sample mean and variance by using `Chan's method`_. 
@@ -49,7 +54,13 @@ class RunningMeanVar(object):
         batch_mean = x.mean(axis=0)
         batch_var = x.var(axis=0)
         batch_N = x.shape[0]
-        
+
+        if njit is not None:
+            self.N = _combine_moments(self.mean.reshape(-1), self.var.reshape(-1), self.N,
+                                      np.asarray(batch_mean).reshape(-1), np.asarray(batch_var).reshape(-1),
+                                      float(batch_N))
+            return
+
         new_N = self.N + batch_N
         delta = batch_mean - self.mean
         new_mean = self.mean + delta*(batch_N/new_N)
@@ -57,7 +68,7 @@ class RunningMeanVar(object):
         M_B = batch_N*batch_var
         M_X = M_A + M_B + (delta**2)*((self.N*batch_N)/new_N)
         new_var = M_X/new_N
-        
+
         self.mean = new_mean
         self.var = new_var
         self.N = new_N
@@ -66,3 +77,16 @@ class RunningMeanVar(object):
     def n(self):
         r"""Returns the total number of samples so far. """
         return int(self.N)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _combine_moments(mean, var, N, batch_mean, batch_var, batch_N):
+        # Chan's parallel update, in-place over the flattened moment buffers.
+        # float64 accumulation is kept on purpose, see the class docstring.
+        new_N = N + batch_N
+        for i in range(mean.size):
+            delta = batch_mean[i] - mean[i]
+            mean[i] += delta*(batch_N/new_N)
+            var[i] = (N*var[i] + batch_N*batch_var[i] + delta*delta*((N*batch_N)/new_N))/new_N
+        return new_N
@@ -1,37 +1,64 @@
+from functools import lru_cache
+
 import numpy as np
+from scipy.ndimage import convolve1d
+from scipy.signal import savgol_coeffs
 from scipy.signal import savgol_filter
 
 
 def smooth_filter(x, window_length, polyorder, **kwargs):
     r"""Smooth a sequence of noisy data points by applying `Savitzky–Golay filter`_. It uses least
     squares to fit a polynomial with a small sliding window and use this polynomial to estimate
-    the point in the center of the sliding window. 
-    
+    the point in the center of the sliding window.
+
     This is useful when a curve is highly noisy, smoothing it out leads to better visualization quality.
-    
+
     .. _Savitzky–Golay filter:
         https://en.wikipedia.org/wiki/Savitzky%E2%80%93Golay_filter
-    
+
     Example:
-    
+
         >>> import matplotlib.pyplot as plt
-    
+
         >>> x = np.linspace(0, 4*2*np.pi, num=100)
         >>> y = x*(np.sin(x) + np.random.random(100)*4)
         >>> y2 = smooth_filter(y, window_length=31, polyorder=10)
-        
+
         >>> plt.plot(x, y)
         >>> plt.plot(x, y2, 'red')
-        
+
     Args:
-        x (list): one-dimensional vector of scalar data points of a curve. 
+        x (list): one-dimensional vector of scalar data points of a curve.
         window_length (int): the length of the filter window
         polyorder (int): the order of the polynomial used to fit the samples
-        
+
     Returns:
         ndarray: an numpy array of smoothed curve data
     """
     x = np.asarray(x)
     assert x.ndim == 1, 'only a single vector of scalar values is supported'
-    out = savgol_filter(x, window_length, polyorder, **kwargs)
+    if kwargs or len(x) < window_length:  # non-default options or too-short input:
+        # delegate to scipy, which raises a clear ValueError for the short case
+        return savgol_filter(x, window_length, polyorder, **kwargs)
+    # solving for the filter coefficients dominates repeated calls, so cache them
+    # and apply via C-implemented correlation, with scipy's 'interp' edge handling
+    x = x.astype(np.float64)
+    coeffs = _cached_savgol_coeffs(window_length, polyorder)
+    out = convolve1d(x, coeffs, axis=-1, mode='constant')
+    halflen = window_length//2
+    _fit_edge(x, 0, window_length, 0, halflen, polyorder, out)
+    _fit_edge(x, len(x) - window_length, len(x), len(x) - halflen, len(x), polyorder, out)
     return out
+
+
+@lru_cache(maxsize=None)
+def _cached_savgol_coeffs(window_length, polyorder):
+    return savgol_coeffs(window_length, polyorder)
+
+
+def _fit_edge(x, window_start, window_stop, interp_start, interp_stop, polyorder, out):
+    # least-squares polynomial fit over the edge window, evaluated at the edge points
+    t = np.arange(window_stop - window_start)
+    poly = np.polynomial.polynomial.polyfit(t, x[window_start:window_stop], polyorder)
+    out[interp_start:interp_stop] = np.polynomial.polynomial.polyval(
+        np.arange(interp_start - window_start, interp_stop - window_start), poly)
@@ -8,9 +8,14 @@ def tensorify(x, device):
             x = x.to(device)
         return x
     elif isinstance(x, np.ndarray):
-        return torch.from_numpy(x).float().to(device)
+        x = np.ascontiguousarray(x)
+    elif isinstance(x, (list, tuple)) and len(x) > 0 and isinstance(x[0], np.ndarray):
+        # batched observations e.g. from vectorized environments: np.stack avoids
+        # the slow element-by-element path taken by np.asarray
+        x = np.stack(x)
     else:
-        return torch.from_numpy(np.asarray(x)).float().to(device)
+        x = np.asarray(x)
+    return torch.from_numpy(x.astype(np.float32, copy=False)).to(device, non_blocking=True)
     
     
 def numpify(x, dtype):
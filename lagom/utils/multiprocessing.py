@@ -120,9 +120,10 @@ class ProcessMaster(ABC):
     def close(self):
         r"""Defines everything required after finishing all the works, e.g. stop all workers, clean up. """
         [master_conn.send('close') for master_conn in self.master_conns]
+        # keep the list here: every recv() must be drained even if an early reply is wrong
         assert all([master_conn.recv() == 'confirmed' for master_conn in self.master_conns])
         
         [master_conn.close() for master_conn in self.master_conns]
-        assert all([master_conn.closed for master_conn in self.master_conns])
+        assert all(master_conn.closed for master_conn in self.master_conns)
         
         [process.join() for process in self.list_process]
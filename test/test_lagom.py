@@ -11,7 +11,10 @@ from lagom import TimeStep
 from lagom import Trajectory
 from lagom import EpisodeRunner
 from lagom import StepRunner
+from lagom import VecStepRunner
 from lagom.envs import TimeStepEnv
+from lagom.envs import make_vec_env
+from lagom.envs.wrappers import VecStepInfo
 from lagom.utils import pickle_load
 
 
@@ -196,3 +199,23 @@ def test_step_runner(env_id, T):
     assert np.allclose(D2[-1][-1].observation, runner.observation)
     assert np.allclose(D[0][-1].observation, D2[0][0].observation)
     assert D2[0][0].first() and D2[0][0].reward is None
+
+
+@pytest.mark.parametrize('env_id', ['CartPole-v1', 'Pendulum-v0'])
+@pytest.mark.parametrize('num_envs', [1, 3])
+@pytest.mark.parametrize('T', [1, 100])
+def test_vec_step_runner(env_id, num_envs, T):
+    env = make_vec_env(lambda: gym.make(env_id), num_envs, 0)
+    env = VecStepInfo(env)
+    agent = RandomAgent(None, env, None)
+    runner = VecStepRunner()
+    D = runner(agent, env, T)
+    assert all([isinstance(traj, Trajectory) for traj in D])
+    assert sum([traj.T for traj in D]) == num_envs*T
+    assert all([traj[0].first() for traj in D])
+    # at most one trajectory per sub-env is cut off at the horizon, the rest terminated
+    assert sum([not traj.finished for traj in D]) <= num_envs
+    assert all([traj[-1].last() for traj in D if traj.finished])
+    for traj in D:
+        for timestep in traj[1:-1]:
+            assert timestep.mid()
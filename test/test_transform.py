@@ -36,9 +36,16 @@ def test_interp_curves():
 
 def test_geometric_cumsum():
     assert np.allclose(geometric_cumsum(0.1, [1, 2, 3]), [1.23, 2.3, 3])
-    assert np.allclose(geometric_cumsum(0.1, [[1, 2, 3, 4], [5, 6, 7, 8]]), 
+    assert np.allclose(geometric_cumsum(0.1, [[1, 2, 3, 4], [5, 6, 7, 8]]),
                        [[1.234, 2.34, 3.4, 4], [5.678, 6.78, 7.8, 8]])
 
+    # all-one mask is equivalent to the unmasked case
+    assert np.allclose(geometric_cumsum(0.1, [1, 2, 3, 4], mask=[1, 1, 1, 1]), [1.234, 2.34, 3.4, 4])
+    # zero mask resets the accumulation e.g. terminal states of concatenated episodes
+    assert np.allclose(geometric_cumsum(0.1, [1, 2, 3, 4], mask=[1, 0, 1, 1]), [1.2, 2, 3.4, 4])
+    assert np.allclose(geometric_cumsum(0.1, [[1, 2, 3, 4], [5, 6, 7, 8]], mask=[[1, 0, 1, 1], [1, 1, 0, 1]]),
+                       [[1.2, 2, 3.4, 4], [5.67, 6.7, 7, 8]])
+
 
 def test_explained_variance():
     assert np.isclose(explained_variance(y_true=[3, -0.5, 2, 7], y_pred=[2.5, 0.0, 2, 8]), 0.9571734666824341)
@@ -90,6 +90,14 @@ def test_tensorify():
     assert np.allclose(x, y)
     del x, y
 
+    # list of ndarrays e.g. batched observations from vectorized environments
+    x = [np.random.randn(4) for _ in range(3)]
+    y = tensorify(x, 'cpu')
+    assert y.shape == (3, 4)
+    assert y.dtype == torch.float32
+    assert np.allclose(np.stack(x), y)
+    del x, y
+
 
 def test_numpify():
     # tensor